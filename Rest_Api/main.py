@@ -1,12 +1,13 @@
-import redis.asyncio as redis
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi_limiter import FastAPILimiter
 from src.config.config import settings
+from src.database.db import redis_client
 from src.routes import auth, contacts, users
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 app.include_router(auth.router, prefix='/api')
 app.include_router(contacts.router, prefix='/api')
@@ -22,8 +23,7 @@ async def startup():
     :return: A coroutine, so we need to wrap it in asyncio
     :doc-author: Trelent
     """
-    r = await redis.Redis(host=settings.redis_host, port=settings.redis_port, db=0, encoding='utf-8', decode_responses=True)
-    await FastAPILimiter.init(r)
+    await FastAPILimiter.init(redis_client)
 
 origins = ['http://localhost:3000']
 app.add_middleware(
@@ -48,4 +48,4 @@ def read_root():
 
 
 if __name__ == '__main__':
-    uvicorn.run(app, host='localhost', port=8000)
+    uvicorn.run('main:app', host='localhost', port=8000, loop='auto', http='auto', workers=settings.workers)
@@ -0,0 +1,24 @@
+"""add contacts pagination index
+
+Revision ID: 2156988a7c8f
+Revises: 8cd3fc6709dc
+Create Date: 2026-10-15 13:05:47.932108
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2156988a7c8f'
+down_revision = '8cd3fc6709dc'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_contacts_user_id_id', 'contacts', ['user_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_user_id_id', table_name='contacts')
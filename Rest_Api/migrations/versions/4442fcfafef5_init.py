@@ -0,0 +1,28 @@
+"""add contacts search indexes
+
+Revision ID: 4442fcfafef5
+Revises: 293cc50c1b47, ec4bcb98b410
+Create Date: 2026-10-15 10:12:31.507214
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4442fcfafef5'
+down_revision = ('293cc50c1b47', 'ec4bcb98b410')
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_contacts_user_id_first_name', 'contacts', ['user_id', 'first_name'], unique=False)
+    op.create_index('ix_contacts_user_id_last_name', 'contacts', ['user_id', 'last_name'], unique=False)
+    op.create_index('ix_contacts_user_id_email', 'contacts', ['user_id', 'email'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_user_id_email', table_name='contacts')
+    op.drop_index('ix_contacts_user_id_last_name', table_name='contacts')
+    op.drop_index('ix_contacts_user_id_first_name', table_name='contacts')
@@ -0,0 +1,26 @@
+"""add contacts birthday index
+
+Revision ID: 8cd3fc6709dc
+Revises: 4442fcfafef5
+Create Date: 2026-10-15 11:40:08.214563
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8cd3fc6709dc'
+down_revision = '4442fcfafef5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_contacts_user_id_birthday', 'contacts',
+                    ['user_id', sa.text('EXTRACT(month FROM date_of_birth)'), sa.text('EXTRACT(day FROM date_of_birth)')],
+                    unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_user_id_birthday', table_name='contacts')
@@ -1,3 +1,4 @@
+import redis.asyncio as redis
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
@@ -7,9 +8,15 @@ from src.config.config import settings
 
 
 SQLALCHEMY_DATABASE_URL = settings.sqlalchemy_database_url
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+engine = create_engine(SQLALCHEMY_DATABASE_URL, pool_size=settings.db_pool_size, max_overflow=settings.db_max_overflow,
+                       pool_pre_ping=True, pool_recycle=1800, query_cache_size=1200)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+redis_pool = redis.BlockingConnectionPool(host=settings.redis_host, port=settings.redis_port, db=0,
+                                          max_connections=settings.redis_max_connections,
+                                          timeout=settings.redis_pool_timeout)
+redis_client = redis.Redis(connection_pool=redis_pool)
 
 
 def get_db():
@@ -28,4 +35,14 @@ def get_db():
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(err))
     finally:
         db.close()
-        
\ No newline at end of file
+
+
+async def get_redis():
+    """
+    The get_redis function returns the Redis client shared by the whole application.
+    All its connections come from a single connection pool created at import time.
+    
+    :return: A redis client
+    :doc-author: Trelent
+    """
+    return redis_client
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, Date, DateTime, ForeignKey, func
+from sqlalchemy import Column, Integer, String, Boolean, Date, DateTime, ForeignKey, Index, extract, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -19,6 +19,14 @@ class Contact(Base):
     user_id = Column(ForeignKey('users.id', ondelete='CASCADE'), default=None)
     user = relationship('User', backref='contacts')
 
+    __table_args__ = (
+        Index('ix_contacts_user_id_id', 'user_id', 'id'),
+        Index('ix_contacts_user_id_first_name', 'user_id', 'first_name'),
+        Index('ix_contacts_user_id_last_name', 'user_id', 'last_name'),
+        Index('ix_contacts_user_id_email', 'user_id', 'email'),
+        Index('ix_contacts_user_id_birthday', 'user_id', extract('month', date_of_birth), extract('day', date_of_birth)),
+    )
+
 
 class User(Base):
     __tablename__ = 'users'
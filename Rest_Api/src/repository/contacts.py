@@ -1,16 +1,20 @@
-from datetime import date
+from datetime import date, timedelta
 
-from sqlalchemy import and_
+from sqlalchemy import and_, or_, delete, extract, lambda_stmt, tuple_
 from sqlalchemy.orm import Session
 
 from src.database.models import Contact, User
 from src.schemas import ContactModel
 
 
-async def get_contacts(skip: int, limit: int, first_name: str, last_name: str, email: str, user: User, db: Session):
+def get_contacts(skip: int, limit: int, first_name: str, last_name: str, email: str, user: User, db: Session,
+                 cursor: int | None = None):
     """
     The get_contacts function returns a list of contacts that match the search criteria.
         If no search criteria is provided, it will return all contacts for the user.
+        All criteria are combined with OR into a single paginated query ordered by contact id.
+        Passing the id of the last contact already received as cursor pages through
+        the results without scanning the skipped rows.
     
     :param skip: int: Skip the first n number of contacts in the database
     :param limit: int: Limit the number of results returned
@@ -19,30 +23,26 @@ async def get_contacts(skip: int, limit: int, first_name: str, last_name: str, e
     :param email: str: Filter the contacts by email
     :param user: User: Get the user id of the logged in user
     :param db: Session: Access the database
+    :param cursor: int | None: Return only contacts with an id greater than the cursor
     :return: A list of contacts
     :doc-author: Trelent
     """
-    first_name_query = db.query(Contact).filter(and_(Contact.first_name == first_name, Contact.user_id == user.id))
-    last_name_query = db.query(Contact).filter(and_(Contact.last_name == last_name, Contact.user_id == user.id))
-    email_query = db.query(Contact).filter(and_(Contact.email == email, Contact.user_id == user.id))
-    if first_name and last_name and email:
-        return first_name_query.union(last_name_query).union(email_query).all()
-    if first_name and last_name:
-        return first_name_query.union(last_name_query).all()
-    if first_name and email:
-        return first_name_query.union(email_query).all()
-    if last_name and email:
-        return last_name_query.union(email_query).all()
+    filters = []
     if first_name:
-        return first_name_query.all()
+        filters.append(Contact.first_name == first_name)
     if last_name:
-        return last_name_query.all()
+        filters.append(Contact.last_name == last_name)
     if email:
-        return email_query.all()
-    return db.query(Contact).filter(Contact.user_id == user.id).offset(skip).limit(limit).all()
+        filters.append(Contact.email == email)
+    criteria = [Contact.user_id == user.id]
+    if filters:
+        criteria.append(or_(*filters))
+    if cursor is not None:
+        criteria.append(Contact.id > cursor)
+    return db.query(Contact).filter(and_(*criteria)).order_by(Contact.id).offset(skip).limit(limit).all()
 
 
-async def get_contacts_birthdays(skip: int, limit: int, user: User, db: Session):
+def get_contacts_birthdays(skip: int, limit: int, user: User, db: Session):
     """
     The get_contacts_birthdays function returns a list of contacts with birthdays in the next 7 days.
         Args:
@@ -58,20 +58,15 @@ async def get_contacts_birthdays(skip: int, limit: int, user: User, db: Session)
     :return: A list of contacts that have their birthdays in the next 7 days
     :doc-author: Trelent
     """
-    contacts_with_birthdays = []
     today = date.today()
-    current_year = today.year
-    contacts = db.query(Contact).filter(Contact.user_id == user.id).offset(skip).limit(limit).all()
-    for contact in contacts:
-        td = contact.date_of_birth.replace(year=current_year) - today
-        if 0 <= td.days <= 7:
-            contacts_with_birthdays.append(contact)
-        else:
-            continue
-    return contacts_with_birthdays
+    days = [today + timedelta(days=offset) for offset in range(8)]
+    birthday = tuple_(extract('month', Contact.date_of_birth), extract('day', Contact.date_of_birth))
+    return db.query(Contact).filter(
+        and_(Contact.user_id == user.id, birthday.in_([(day.month, day.day) for day in days]))
+    ).order_by(Contact.id).offset(skip).limit(limit).all()
 
 
-async def get_contact_by_id(contact_id: int, user: User, db: Session):
+def get_contact_by_id(contact_id: int, user: User, db: Session):
     """
     The get_contact_by_id function returns a contact by its id.
         Args:
@@ -87,10 +82,13 @@ async def get_contact_by_id(contact_id: int, user: User, db: Session):
     :return: A contact object with the given id if it exists
     :doc-author: Trelent
     """
-    return db.query(Contact).filter(and_(Contact.id == contact_id, Contact.user_id == user.id)).first()
+    contact = db.get(Contact, contact_id)
+    if contact is None or contact.user_id != user.id:
+        return None
+    return contact
 
 
-async def create_contact(body: ContactModel, user: User, db: Session):
+def create_contact(body: ContactModel, user: User, db: Session):
     """
     The create_contact function creates a new contact in the database.
         
@@ -104,11 +102,10 @@ async def create_contact(body: ContactModel, user: User, db: Session):
     contact = Contact(**body.dict(), user_id=user.id)
     db.add(contact)
     db.commit()
-    db.refresh(contact)
     return contact
 
 
-async def update_contact(contact_id: int, body: ContactModel, user: User, db: Session):
+def update_contact(contact_id: int, body: ContactModel, user: User, db: Session):
     """
     The update_contact function updates a contact in the database.
         Args:
@@ -124,7 +121,7 @@ async def update_contact(contact_id: int, body: ContactModel, user: User, db: Se
     :return: The contact object
     :doc-author: Trelent
     """
-    contact = db.query(Contact).filter(and_(Contact.id == contact_id, Contact.user_id == user.id)).first()
+    contact = get_contact_by_id(contact_id, user, db)
     if contact:
         contact.first_name = body.first_name
         contact.last_name = body.last_name
@@ -135,7 +132,7 @@ async def update_contact(contact_id: int, body: ContactModel, user: User, db: Se
     return contact
 
 
-async def remove_contact(contact_id: int, user: User, db: Session):
+def remove_contact(contact_id: int, user: User, db: Session):
     """
     The remove_contact function removes a contact from the database.
         Args:
@@ -143,16 +140,18 @@ async def remove_contact(contact_id: int, user: User, db: Session):
             user (User): The user who owns the contacts list.
             db (Session): A session object for interacting with the database.
         Returns: 
-            Contact: The deleted Contact object.
+            int: The number of deleted contacts, 0 if the user has no contact with this id.
     
     :param contact_id: int: Specify the id of the contact to be removed
     :param user: User: Get the user_id from the user object
     :param db: Session: Pass the database session to the function
-    :return: The contact that was removed
+    :return: The number of contacts that were removed
     :doc-author: Trelent
     """
-    contact = db.query(Contact).filter(and_(Contact.id == contact_id, Contact.user_id == user.id)).first()
-    if contact:
-        db.delete(contact)
-        db.commit()
-    return contact
+    user_id = user.id
+    result = db.execute(
+        lambda_stmt(lambda: delete(Contact).where(Contact.id == contact_id, Contact.user_id == user_id)),
+        execution_options={'synchronize_session': False},
+    )
+    db.commit()
+    return result.rowcount
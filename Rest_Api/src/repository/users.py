@@ -1,11 +1,15 @@
+import logging
+
 from libgravatar import Gravatar
 from sqlalchemy.orm import Session
 
 from src.database.models import User
 from src.schemas import UserModel
 
+logger = logging.getLogger(__name__)
+
 
-async def get_user_by_email(email: str, db: Session):
+def get_user_by_email(email: str, db: Session):
     """
     The get_user_by_email function takes in an email and a database session, then returns the user with that email.
     
@@ -17,7 +21,7 @@ async def get_user_by_email(email: str, db: Session):
     return db.query(User).filter(User.email == email).first()
 
 
-async def create_user(body: UserModel, db: Session):
+def create_user(body: UserModel, db: Session):
     """
     The create_user function creates a new user in the database.
         Args:
@@ -34,15 +38,14 @@ async def create_user(body: UserModel, db: Session):
         g = Gravatar(body.email)
         avatar = g.get_image()
     except Exception as e:
-        print(e)
+        logger.warning('Gravatar avatar for %s failed', body.email, exc_info=e)
     new_user = User(**body.dict(), avatar=avatar)
     db.add(new_user)
     db.commit()
-    db.refresh(new_user)
     return new_user
 
 
-async def update_token(user: User, token: str | None, db: Session):
+def update_token(user: User, token: str | None, db: Session):
     """
     The update_token function updates the refresh_token for a user.
     
@@ -56,7 +59,7 @@ async def update_token(user: User, token: str | None, db: Session):
     db.commit()
 
 
-async def confirmed_email(email: str, db: Session) -> None:
+def confirmed_email(email: str, db: Session) -> None:
     """
     The confirmed_email function sets the confirmed field of a user to True.
     
@@ -65,12 +68,12 @@ async def confirmed_email(email: str, db: Session) -> None:
     :return: None
     :doc-author: Trelent
     """
-    user = await get_user_by_email(email, db)
+    user = get_user_by_email(email, db)
     user.confirmed = True
     db.commit()
 
 
-async def update_avatar(email, url: str, db: Session) -> User:
+def update_avatar(email, url: str, db: Session) -> User:
     """
     The update_avatar function updates the avatar of a user.
     
@@ -85,7 +88,7 @@ async def update_avatar(email, url: str, db: Session) -> User:
     :return: The user object
     :doc-author: Trelent
     """
-    user = await get_user_by_email(email, db)
+    user = get_user_by_email(email, db)
     user.avatar = url
     db.commit()
     return user
@@ -15,7 +15,7 @@ security = HTTPBearer()
 
 
 @router.post('/signup', response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def signup(body: UserModel, background_tasks: BackgroundTasks, request: Request, db: Session = Depends(get_db)):
+def signup(body: UserModel, background_tasks: BackgroundTasks, request: Request, db: Session = Depends(get_db)):
     """
     The signup function creates a new user in the database.
         It also sends an email to the user's email address for confirmation.
@@ -29,17 +29,17 @@ async def signup(body: UserModel, background_tasks: BackgroundTasks, request: Re
     :return: A dict with the new user and a message
     :doc-author: Trelent
     """
-    exist_user = await repository_users.get_user_by_email(body.email, db)
+    exist_user = repository_users.get_user_by_email(body.email, db)
     if exist_user:
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail='Account already exists')
     body.password = auth_service.get_password_hash(body.password)
-    new_user = await repository_users.create_user(body, db)
+    new_user = repository_users.create_user(body, db)
     background_tasks.add_task(send_email, new_user.email, new_user.username, request.base_url)
     return {'user': new_user, 'detail': 'User successfully created. Check your email for confirmation.'}
 
 
 @router.post('/login', response_model=TokenModel)
-async def login(body: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+def login(body: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     """
     The login function is used to authenticate a user.
     
@@ -48,7 +48,7 @@ async def login(body: OAuth2PasswordRequestForm = Depends(), db: Session = Depen
     :return: An access token and a refresh token
     :doc-author: Trelent
     """
-    user = await repository_users.get_user_by_email(body.username, db)
+    user = repository_users.get_user_by_email(body.username, db)
     if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Invalid email')
     if not user.confirmed:
@@ -56,14 +56,14 @@ async def login(body: OAuth2PasswordRequestForm = Depends(), db: Session = Depen
     if not auth_service.verify_password(body.password, user.password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Invalid password')
     # Generate JWT
-    access_token = await auth_service.create_access_token(data={'sub': user.email})
-    refresh_token = await auth_service.create_refresh_token(data={'sub': user.email})
-    await repository_users.update_token(user, refresh_token, db)
+    access_token = auth_service.create_access_token(data={'sub': user.email})
+    refresh_token = auth_service.create_refresh_token(data={'sub': user.email})
+    repository_users.update_token(user, refresh_token, db)
     return {'access_token': access_token, 'refresh_token': refresh_token, 'token_type': 'bearer'}
 
 
 @router.get('/refresh_token', response_model=TokenModel)
-async def refresh_token(credentials: HTTPAuthorizationCredentials = Security(security), db: Session = Depends(get_db)):
+def refresh_token(credentials: HTTPAuthorizationCredentials = Security(security), db: Session = Depends(get_db)):
     """
     The refresh_token function is used to refresh the access token.
     It takes in a refresh token and returns a new access_token, refresh_token, and token type.
@@ -74,20 +74,20 @@ async def refresh_token(credentials: HTTPAuthorizationCredentials = Security(sec
     :doc-author: Trelent
     """
     token = credentials.credentials
-    email = await auth_service.decode_refresh_token(token)
-    user = await repository_users.get_user_by_email(email, db)
+    email = auth_service.decode_refresh_token(token)
+    user = repository_users.get_user_by_email(email, db)
     if user.refresh_token != token:
-        await repository_users.update_token(user, None, db)
+        repository_users.update_token(user, None, db)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='Invalid refresh token')
 
-    access_token = await auth_service.create_access_token(data={'sub': email})
-    refresh_token = await auth_service.create_refresh_token(data={'sub': email})
-    await repository_users.update_token(user, refresh_token, db)
+    access_token = auth_service.create_access_token(data={'sub': email})
+    refresh_token = auth_service.create_refresh_token(data={'sub': email})
+    repository_users.update_token(user, refresh_token, db)
     return {'access_token': access_token, 'refresh_token': refresh_token, 'token_type': 'bearer'}
 
 
 @router.get('/confirmed_email/{token}')
-async def confirmed_email(token: str, db: Session = Depends(get_db)):
+def confirmed_email(token: str, db: Session = Depends(get_db)):
     """
     The confirmed_email function is used to confirm a user's email address.
         The function takes the token from the URL and uses it to get the user's email address.
@@ -98,18 +98,18 @@ async def confirmed_email(token: str, db: Session = Depends(get_db)):
     :return: A dict with a message, but the response is not returned to the client
     :doc-author: Trelent
     """
-    email = await auth_service.get_email_from_token(token)
-    user = await repository_users.get_user_by_email(email, db)
+    email = auth_service.get_email_from_token(token)
+    user = repository_users.get_user_by_email(email, db)
     if user is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail='Verification error')
     if user.confirmed:
         return {'message': 'Your email is already confirmed'}
-    await repository_users.confirmed_email(email, db)
+    repository_users.confirmed_email(email, db)
     return {'message': 'Email confirmed'}
 
 
 @router.post('/request_email')
-async def request_email(body: RequestEmail, background_tasks: BackgroundTasks, request: Request, db: Session = Depends(get_db)):
+def request_email(body: RequestEmail, background_tasks: BackgroundTasks, request: Request, db: Session = Depends(get_db)):
     """
     The request_email function is used to send an email to the user with a link that will allow them
     to confirm their email address. The function takes in a RequestEmail object, which contains the
@@ -123,7 +123,7 @@ async def request_email(body: RequestEmail, background_tasks: BackgroundTasks, r
     :return: A dictionary with a message
     :doc-author: Trelent
     """
-    user = await repository_users.get_user_by_email(body.email, db)
+    user = repository_users.get_user_by_email(body.email, db)
 
     if user.confirmed:
         return {'message': 'Your email is already confirmed'}
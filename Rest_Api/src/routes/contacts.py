@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Depends, status, Query
+from fastapi import APIRouter, HTTPException, Depends, Response, status, Query
 from fastapi_limiter.depends import RateLimiter
 from sqlalchemy.orm import Session
 
@@ -15,12 +15,13 @@ router = APIRouter(prefix='/contacts', tags=['contacts'])
 
 @router.get('/', response_model=List[ContactResponse], name='Get a list of all contacts or contacts filtered by query parameters such as first name, last name or email', description='No more than 10 requests per minute',
             dependencies=[Depends(RateLimiter(times=10, seconds=60))])
-async def get_contact_by_params(skip: int = 0, limit: int = Query(default=10),
-                              first_name: Optional[str] = Query(default=None),
-                              last_name: Optional[str] = Query(default=None),
-                              email: Optional[str] = Query(default=None),
-                              db: Session = Depends(get_db),
-                              current_user: User = Depends(auth_service.get_current_user)):
+def get_contact_by_params(skip: int = 0, limit: int = Query(default=10),
+                          first_name: Optional[str] = Query(default=None),
+                          last_name: Optional[str] = Query(default=None),
+                          email: Optional[str] = Query(default=None),
+                          cursor: Optional[int] = Query(default=None),
+                          db: Session = Depends(get_db),
+                          current_user: User = Depends(auth_service.get_current_user)):
     """
     The get_contact_by_params function returns a list of contacts that match the parameters passed in.
         The function takes in skip, limit, first_name, last_name and email as query parameters.
@@ -31,12 +32,13 @@ async def get_contact_by_params(skip: int = 0, limit: int = Query(default=10),
     :param first_name: Optional[str]: Filter the results by first name
     :param last_name: Optional[str]: Specify the last name of a contact
     :param email: Optional[str]: Filter the contacts by email
+    :param cursor: Optional[int]: Return contacts after the contact with this id
     :param db: Session: Pass the database session to the function
     :param current_user: User: Get the user id of the current logged in user
     :return: A list of contacts
     :doc-author: Trelent
     """
-    contact = await repository_contacts.get_contacts(skip, limit, first_name, last_name, email, current_user, db)
+    contact = repository_contacts.get_contacts(skip, limit, first_name, last_name, email, current_user, db, cursor)
     if not contact:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Contacts with requested parameters not found')
     return contact
@@ -44,7 +46,7 @@ async def get_contact_by_params(skip: int = 0, limit: int = Query(default=10),
 
 @router.get('/birthdays', response_model=list[ContactResponse], name='Get list of contacts with birthdays for the next 7 days', description='No more than 10 requests per minute',
             dependencies=[Depends(RateLimiter(times=10, seconds=60))])
-async def get_birthdays(skip: int = 0, limit: int = Query(default=10), db: Session = Depends(get_db), current_user: User = Depends(auth_service.get_current_user)):
+def get_birthdays(skip: int = 0, limit: int = Query(default=10), db: Session = Depends(get_db), current_user: User = Depends(auth_service.get_current_user)):
     """
     The get_birthdays function returns a list of contacts with birthdays in the next 7 days.
         The function takes an optional skip and limit parameter to paginate through the results.
@@ -57,7 +59,7 @@ async def get_birthdays(skip: int = 0, limit: int = Query(default=10), db: Sessi
     :return: A list of birthdays for the next 7 days
     :doc-author: Trelent
     """
-    contacts = await repository_contacts.get_contacts_birthdays(skip, limit, current_user, db)
+    contacts = repository_contacts.get_contacts_birthdays(skip, limit, current_user, db)
     if not contacts:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Contacts with birthdays for the next 7 days not found')
     return contacts
@@ -65,7 +67,7 @@ async def get_birthdays(skip: int = 0, limit: int = Query(default=10), db: Sessi
 
 @router.get('/{contact_id}', response_model=ContactResponse, name='Get contact by id', description='No more than 10 requests per minute',
             dependencies=[Depends(RateLimiter(times=10, seconds=60))])
-async def get_contact(contact_id: int, db: Session = Depends(get_db), current_user: User = Depends(auth_service.get_current_user)):
+def get_contact(contact_id: int, db: Session = Depends(get_db), current_user: User = Depends(auth_service.get_current_user)):
     """
     The get_contact function returns a contact by id.
         Args:
@@ -79,7 +81,7 @@ async def get_contact(contact_id: int, db: Session = Depends(get_db), current_us
     :return: A contact object
     :doc-author: Trelent
     """
-    contact = await repository_contacts.get_contact_by_id(contact_id, current_user, db)
+    contact = repository_contacts.get_contact_by_id(contact_id, current_user, db)
     if contact is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Contact with requested id not found')
     return contact
@@ -87,7 +89,7 @@ async def get_contact(contact_id: int, db: Session = Depends(get_db), current_us
 
 @router.post('/', response_model=ContactResponse, description='No more than 3 requests per 5 minutes',
             dependencies=[Depends(RateLimiter(times=3, minutes=5))], status_code=status.HTTP_201_CREATED)
-async def create_contact(body: ContactModel, db: Session = Depends(get_db), current_user: User = Depends(auth_service.get_current_user)):
+def create_contact(body: ContactModel, db: Session = Depends(get_db), current_user: User = Depends(auth_service.get_current_user)):
     """
     The create_contact function creates a new contact in the database.
         The function takes in a ContactModel object and returns the newly created contact.
@@ -98,12 +100,12 @@ async def create_contact(body: ContactModel, db: Session = Depends(get_db), curr
     :return: The new_contact object
     :doc-author: Trelent
     """
-    new_contact = await repository_contacts.create_contact(body, current_user, db)
+    new_contact = repository_contacts.create_contact(body, current_user, db)
     return new_contact
 
 
 @router.put('/{contact_id}', response_model=ContactResponse)
-async def update_contact(body: ContactModel, contact_id: int, db: Session = Depends(get_db), current_user: User = Depends(auth_service.get_current_user)):
+def update_contact(body: ContactModel, contact_id: int, db: Session = Depends(get_db), current_user: User = Depends(auth_service.get_current_user)):
     """
     The update_contact function updates a contact in the database.
         The function takes a ContactModel object as input, which is used to update the contact's information.
@@ -118,14 +120,14 @@ async def update_contact(body: ContactModel, contact_id: int, db: Session = Depe
     :return: A contactmodel object
     :doc-author: Trelent
     """
-    contact = await repository_contacts.update_contact(contact_id, body, current_user, db)
+    contact = repository_contacts.update_contact(contact_id, body, current_user, db)
     if contact is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Contact with requested id not found')
     return contact
 
 
 @router.delete('/{contact_id}', status_code=status.HTTP_204_NO_CONTENT)
-async def remove_tag(contact_id: int, db: Session = Depends(get_db), current_user: User = Depends(auth_service.get_current_user)):
+def remove_tag(contact_id: int, db: Session = Depends(get_db), current_user: User = Depends(auth_service.get_current_user)):
     """
     The remove_tag function removes a tag from the database.
         Args:
@@ -136,10 +138,10 @@ async def remove_tag(contact_id: int, db: Session = Depends(get_db), current_use
     :param contact_id: int: Specify the id of the contact to be removed
     :param db: Session: Pass the database session to the function
     :param current_user: User: Get the current user from the database
-    :return: A contact object
+    :return: An empty response
     :doc-author: Trelent
     """
-    contact = await repository_contacts.remove_contact(contact_id, current_user, db)
-    if contact is None:
+    removed = repository_contacts.remove_contact(contact_id, current_user, db)
+    if not removed:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail='Contact with requested id not found')
-    return contact
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -1,9 +1,11 @@
 from fastapi import APIRouter, Depends, status, UploadFile, File
+from redis.asyncio import Redis
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 import cloudinary
 import cloudinary.uploader
 
-from src.database.db import get_db
+from src.database.db import get_db, get_redis
 from src.database.models import User
 from src.repository import users as repository_users
 from src.services.auth import auth_service
@@ -33,7 +35,8 @@ async def read_users_me(current_user: User = Depends(auth_service.get_current_us
 
 
 @router.patch('/avatar', response_model=UserDb)
-async def update_avatar_user(file: UploadFile = File(), current_user: User = Depends(auth_service.get_current_user), db: Session = Depends(get_db)):
+async def update_avatar_user(file: UploadFile = File(), current_user: User = Depends(auth_service.get_current_user), db: Session = Depends(get_db),
+                             cache: Redis = Depends(get_redis)):
     """
     The update_avatar_user function updates the avatar of a user.
         Args:
@@ -44,6 +47,7 @@ async def update_avatar_user(file: UploadFile = File(), current_user: User = Dep
     :param file: UploadFile: Upload a file to the server
     :param current_user: User: Get the current user object from the database
     :param db: Session: Get the database session
+    :param cache: Redis: Get the shared redis client
     :return: A user object
     :doc-author: Trelent
     """
@@ -54,9 +58,10 @@ async def update_avatar_user(file: UploadFile = File(), current_user: User = Dep
         secure=True
     )
 
-    r = cloudinary.uploader.upload(
-        file.file, public_id=f'ContactsApp/{current_user.username}', overwrite=True)
+    r = await run_in_threadpool(
+        cloudinary.uploader.upload, file.file, public_id=f'ContactsApp/{current_user.username}', overwrite=True)
     src_url = cloudinary.CloudinaryImage(f'ContactsApp/{current_user.username}').build_url(
         width=250, height=250, crop='fill', version=r.get('version'))
-    user = await repository_users.update_avatar(current_user.email, src_url, db)
+    user = await run_in_threadpool(repository_users.update_avatar, current_user.email, src_url, db)
+    await cache.delete(f'user:{current_user.email}')
     return user
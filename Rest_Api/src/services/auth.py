@@ -1,5 +1,6 @@
 import pickle
-import redis
+from functools import lru_cache
+from time import time
 from typing import Optional
 
 from jose import JWTError, jwt
@@ -8,18 +9,34 @@ from fastapi.security import OAuth2PasswordBearer
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
-from src.database.db import get_db
+from src.database.db import get_db, redis_client
 from src.repository import users as repository_users
 from src.config.config import settings
 
 
+@lru_cache(maxsize=10_000)
+def _decode_token(token: str, secret_key: str, algorithm: str) -> dict:
+    """
+    The _decode_token function verifies and decodes a JWT, remembering the payload of each token it has seen.
+        Repeated requests with the same token skip the signature check, so callers must still check 'exp'.
+    
+    :param token: str: Pass in the token to decode
+    :param secret_key: str: Verify the signature of the token
+    :param algorithm: str: Specify the algorithm used to sign the token
+    :return: The payload of the token
+    :doc-author: Trelent
+    """
+    return jwt.decode(token, secret_key, algorithms=[algorithm])
+
+
 class Auth:
     pwd_context = CryptContext(schemes=['bcrypt'], deprecated='auto')
     SECRET_KEY = settings.secret_key
     ALGORITHM = settings.algorithm
     oauth2_scheme = OAuth2PasswordBearer(tokenUrl='/api/auth/login')
-    r = redis.Redis(host=settings.redis_host, port=settings.redis_port, db=0)
+    r = redis_client
 
     def verify_password(self, plain_password, hashed_password):
         """
@@ -47,7 +64,7 @@ class Auth:
         """
         return self.pwd_context.hash(password)
 
-    async def create_access_token(self, data: dict, expires_delta: Optional[float] = None):
+    def create_access_token(self, data: dict, expires_delta: Optional[float] = None):
         """
         The create_access_token function creates a new access token for the user.
             
@@ -67,7 +84,7 @@ class Auth:
         encoded_access_token = jwt.encode(to_encode, self.SECRET_KEY, algorithm=self.ALGORITHM)
         return encoded_access_token
 
-    async def create_refresh_token(self, data: dict, expires_delta: Optional[float] = None):
+    def create_refresh_token(self, data: dict, expires_delta: Optional[float] = None):
         """
         The create_refresh_token function creates a refresh token for the user.
             Args:
@@ -89,7 +106,7 @@ class Auth:
         encoded_refresh_token = jwt.encode(to_encode, self.SECRET_KEY, algorithm=self.ALGORITHM)
         return encoded_refresh_token
 
-    async def decode_refresh_token(self, refresh_token: str):
+    def decode_refresh_token(self, refresh_token: str):
         """
         The decode_refresh_token function takes a refresh token and decodes it.
             If the scope is 'refresh_token', then we return the email address of the user.
@@ -128,7 +145,9 @@ class Auth:
         )
 
         try:
-            payload = jwt.decode(token, self.SECRET_KEY, algorithms=[self.ALGORITHM])
+            payload = _decode_token(token, self.SECRET_KEY, self.ALGORITHM)
+            if 'exp' in payload and payload['exp'] <= time():
+                raise credentials_exception
             if payload['scope'] == 'access_token':
                 email = payload['sub']
                 if email is None:
@@ -138,13 +157,12 @@ class Auth:
         except JWTError as e:
             raise credentials_exception
 
-        user = self.r.get(f'user:{email}')
+        user = await self.r.get(f'user:{email}')
         if user is None:
-            user = await repository_users.get_user_by_email(email, db)
+            user = await run_in_threadpool(repository_users.get_user_by_email, email, db)
             if user is None:
                 raise credentials_exception
-            self.r.set(f'user:{email}', pickle.dumps(user))
-            self.r.expire(f'user:{email}', 900)
+            await self.r.set(f'user:{email}', pickle.dumps(user), ex=900)
         else:
             user = pickle.loads(user)
         return user
@@ -167,7 +185,7 @@ class Auth:
         return token
     
     
-    async def get_email_from_token(self, token: str):
+    def get_email_from_token(self, token: str):
         """
         The get_email_from_token function takes a token as an argument and returns the email associated with that token.
             If the token is invalid, it raises an HTTPException.
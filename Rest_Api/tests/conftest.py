@@ -1,23 +1,30 @@
+from datetime import date
+from unittest.mock import MagicMock
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from main import app
-from src.database.models import Base
+from src.database.models import Base, Contact
 from src.database.db import get_db
+from src.schemas import ContactModel
 
 
-SQLALCHEMY_DATABASE_URL = 'sqlite:///./test.db'
+SQLALCHEMY_DATABASE_URL = 'sqlite://'
 
 engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={
-                       'check_same_thread': False})
+                       'check_same_thread': False}, poolclass=StaticPool)
 TestingSessionLocal = sessionmaker(
     autocommit=False, autoflush=False, bind=engine)
 
+_DOB = date(1994, 5, 5)
+
 
-@pytest.fixture(scope='module')
-def session():
+@pytest.fixture(scope='session')
+def db_session():
 
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
@@ -29,20 +36,84 @@ def session():
         db.close()
 
 
-@pytest.fixture(scope='module')
-def client(session):
+@pytest.fixture(scope='session')
+def client(db_session):
 
     def override_get_db():
         try:
-            yield session
+            yield db_session
         finally:
-            session.close()
+            db_session.close()
 
     app.dependency_overrides[get_db] = override_get_db
 
     yield TestClient(app)
 
 
-@pytest.fixture(scope='module')
+@pytest.fixture(scope='session')
 def user():
     return {'username': 'Trafalgar', 'email': 'trafalgar_law@meta.ua', 'password': '987654321'}
+
+
+@pytest.fixture(scope='session')
+def session_template():
+    """
+    The session_template function is a fixture that creates the mocked database session once per test run.
+    Building a MagicMock with spec=Session inspects the whole Session class, so it is done only once.
+
+    :return: A magicmock object
+    :doc-author: Trelent
+    """
+    return MagicMock(spec=Session)
+
+
+@pytest.fixture
+def session(session_template):
+    """
+    The session function is a fixture that resets the shared mocked database session before each test function,
+    so that return values and side effects configured by one test do not leak into the next one.
+
+    :param session_template: Get the shared mocked session
+    :return: A magicmock object
+    :doc-author: Trelent
+    """
+    session_template.reset_mock(return_value=True, side_effect=True)
+    return session_template
+
+
+@pytest.fixture
+def contact_test():
+    """
+    The contact_test function is a fixture that creates a contact object with the following attributes:
+    id = 1, first_name = 'Luffy', last_name = 'MonkeyD', email='strawhatcaptain@meta.ua', phone='+3057218410'
+
+    :return: A new instance of the contact class with a set of parameters
+    :doc-author: Trelent
+    """
+    return Contact(
+        id=1,
+        first_name='Luffy',
+        last_name='MonkeyD',
+        email='strawhatcaptain@meta.ua',
+        phone='+3057218410',
+        date_of_birth=_DOB,
+        user_id=1,
+    )
+
+
+@pytest.fixture(scope='session')
+def contact_body():
+    """
+    The contact_body function is a fixture that builds the request body of the test contact once per test run.
+    The body is built without validation, as the repository functions only read its fields.
+
+    :return: A contactmodel object
+    :doc-author: Trelent
+    """
+    return ContactModel.construct(
+        first_name='Luffy',
+        last_name='MonkeyD',
+        email='strawhatcaptain@meta.ua',
+        phone='strawhatcaptain@meta.ua',
+        date_of_birth=_DOB,
+    )
@@ -67,21 +67,21 @@ def test_login_user_not_confirmed(client, user):
     assert data['detail'] == 'Email not confirmed'
 
 
-def test_login_user(client, session, user):
+def test_login_user(client, db_session, user):
     """
     The test_login_user function tests the login functionality of the application.
     It first creates a user and then logs in with that user's credentials.
     
     
     :param client: Create a test client for the flask application
-    :param session: Access the database
+    :param db_session: Access the database
     :param user: Get the user data from the fixture
     :return: A 200 status code, the token_type is a bearer
     :doc-author: Trelent
     """
-    current_user: User = session.query(User).filter(User.email == user.get('email')).first()
+    current_user: User = db_session.query(User).filter(User.email == user.get('email')).first()
     current_user.confirmed = True
-    session.commit()
+    db_session.commit()
     response = client.post(
         '/api/auth/login',
         data={'username': user.get('email'), 'password': user.get('password')},
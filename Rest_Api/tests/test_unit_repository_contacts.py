@@ -1,12 +1,9 @@
-import datetime
-import unittest
-from unittest.mock import MagicMock
-from datetime import date
+from datetime import date, timedelta
+from types import SimpleNamespace
 
-from sqlalchemy.orm import Session
+import pytest
 
 from src.database.models import Contact, User
-from src.schemas import ContactModel
 from src.repository.contacts import (
     get_contact_by_id,
     get_contacts,
@@ -17,220 +14,344 @@ from src.repository.contacts import (
 )
 
 
-class TestContacts(unittest.IsolatedAsyncioTestCase):
-
-    def setUp(self):
-        """
-        The setUp function is called before each test function.
-        It creates a new session and user object, as well as a contact object with the following attributes:
-        id = 1, first_name = 'Luffy', last_name = 'MonkeyD', email='strawhatcaptain@meta.ua', phone='+3057218410'
-        
-        :param self: Represent the instance of the object that calls this method
-        :return: A new instance of the contact class with a set of parameters
-        :doc-author: Trelent
-        """
-        self.session = MagicMock(spec=Session)
-        self.user = User(id=1)
-        self.contact_test = Contact(
-            id=1,
-            first_name='Luffy',
-            last_name='MonkeyD',
-            email='strawhatcaptain@meta.ua',
-            phone='+3057218410',
-            date_of_birth=datetime.date(year=1994, month=5, day=5),
-        )
+pytestmark = pytest.mark.repo
+
+_EMPTY_CONTACT = Contact()
+
+_TODAY = date.today()
+
+_BIRTHDAY_CONTACTS = (
+    Contact(id=1, first_name='Luffy', last_name='Monkey',
+            email='strawhatcaptain@meta.ua', date_of_birth=_TODAY),
+    Contact(id=2, first_name='Zoro', last_name='Roronoa',
+            email='strawhatswordsman@meta.ua', date_of_birth=_TODAY),
+)
+
+
+@pytest.fixture
+def query_chain(session):
+    """
+    The query_chain function is a fixture that walks the mocked query chain used by the contacts repository once
+    and returns its final call, so that tests can set a return value without rebuilding the chain.
+
+    :param session: Get the mocked database session
+    :return: The all call of the paginated query ordered by id
+    :doc-author: Trelent
+    """
+    filtered = session.query.return_value.filter.return_value
+    return SimpleNamespace(
+        ordered_all=filtered.order_by.return_value.offset.return_value.limit.return_value.all,
+    )
+
+
+@pytest.fixture
+def user():
+    """
+    The user function is a fixture that creates the user who owns the contacts in each test function.
+
+    :return: A user object with id = 1
+    :doc-author: Trelent
+    """
+    return User(id=1)
+
+
+def test_get_contacts(session, query_chain, user, contact_test):
+    """
+    The test_get_contacts function tests the get_contacts function.
+        It does this by mocking out the database session and returning a list of contacts.
+        The test then asserts that the result is equal to what was returned from the mocked database.
+
+    :param session: Mock the database session
+    :param query_chain: Set the result of the mocked query
+    :param user: Pass the owner of the contacts
+    :param contact_test: Pass the contact returned by the mocked database
+    :return: The contacts list
+    :doc-author: Trelent
+    """
+    contacts = [contact_test, _EMPTY_CONTACT, _EMPTY_CONTACT]
+    query_chain.ordered_all.return_value = contacts
+    result = get_contacts(skip=0, limit=10, first_name='', last_name='', email='', user=user, db=session)
+    assert result == contacts
+
+
+def test_get_contacts_after_cursor(session, query_chain, user, contact_test):
+    """
+    The test_get_contacts_after_cursor function tests the get_contacts function with a cursor.
+        The contacts following the cursor are returned from the same ordered query,
+        which must be filtered by Contact.id > cursor.
+
+    :param session: Mock the database session
+    :param query_chain: Set the result of the mocked query
+    :param user: Pass the owner of the contacts
+    :param contact_test: Pass the contact used as the cursor
+    :return: The contacts list
+    :doc-author: Trelent
+    """
+    contacts = [Contact(id=2), Contact(id=3)]
+    query_chain.ordered_all.return_value = contacts
+    result = get_contacts(skip=0, limit=10, first_name='', last_name='', email='', user=user, db=session,
+                          cursor=contact_test.id)
+    assert result == contacts
+    criteria = session.query.return_value.filter.call_args.args[0].clauses
+    assert any(criterion.compare(Contact.id > contact_test.id) for criterion in criteria)
+
+
+@pytest.mark.parametrize('field', ['first_name', 'last_name', 'email'])
+def test_get_contacts_filter(field, session, query_chain, user, contact_test):
+    """
+    The test_get_contacts_filter function tests the get_contacts function with a filter by first name, last name or email.
+        The test creates a list of contacts, and then sets the return value of
+        the ordered query to be that list of contacts (this is done so that we can test what happens when
+        there are multiple results returned from the database). Then, it calls get_contacts with the filter parameter set to
+        contact_test's attribute of the same name (which was set in the fixture), and asserts that result is equal to our list of contacts.
+
+    :param field: Specify the contact attribute used as a filter
+    :param session: Mock the database session
+    :param query_chain: Set the result of the mocked query
+    :param user: Pass the owner of the contacts
+    :param contact_test: Pass the contact whose attribute is used as a filter
+    :return: The list of contacts that match the filter
+    :doc-author: Trelent
+    """
+    contacts = [contact_test, _EMPTY_CONTACT, _EMPTY_CONTACT]
+    query_chain.ordered_all.return_value = contacts
+    filters = {'first_name': '', 'last_name': '', 'email': '', field: getattr(contact_test, field)}
+    result = get_contacts(skip=0, limit=10, user=user, db=session, **filters)
+    assert result == contacts
+
+
+def test_get_contact_by_id(session, user, contact_test):
+    """
+    The test_get_contact_by_id function tests the get_contact_by_id function.
+        It does this by mocking the session object and returning a contact owned by the user.
+        The test then asserts that the result is equal to that contact.
+
+    :param session: Mock the database session
+    :param user: Pass the owner of the contact
+    :param contact_test: Pass the contact returned by the mocked database
+    :return: A contact
+    :doc-author: Trelent
+    """
+    session.get.return_value = contact_test
+    result = get_contact_by_id(contact_id=contact_test.id, user=user, db=session)
+    assert result == contact_test
+
+
+def test_get_contact_by_id_other_user(session, user):
+    """
+    The test_get_contact_by_id_other_user function tests that get_contact_by_id does not return
+    a contact that belongs to another user, even if a contact with the given id exists.
+
+    :param session: Mock the database session
+    :param user: Pass the user who does not own the contact
+    :return: None
+    :doc-author: Trelent
+    """
+    session.get.return_value = Contact(id=2, user_id=2)
+    result = get_contact_by_id(contact_id=2, user=user, db=session)
+    assert result is None
+
+
+def test_create_contact(session, user, contact_body):
+    """
+    The test_create_contact function tests the create_contact function in the contacts.py file.
+    It creates a ContactModel object and passes it to the create_contact function, which should return a new contact with an id attribute.
 
-    async def test_get_contacts(self):
-        """
-        The test_get_contacts function tests the get_contacts function.
-            It does this by mocking out the database session and returning a list of contacts.
-            The test then asserts that the result is equal to what was returned from the mocked database.
-        
-        :param self: Access the instance of the class
-        :return: The contacts list
-        :doc-author: Trelent
-        """
-        contacts = [self.contact_test, Contact(), Contact()]
-        self.session.query().filter().offset().limit().all.return_value = contacts
-        result = await get_contacts(skip=0, limit=10, first_name='', last_name='', email='', user=self.user, db=self.session)
-        self.assertEqual(result, contacts)
-
-    async def test_get_contacts_filter_by_first_name(self):
-        """
-        The test_get_contacts_filter_by_first_name function tests the get_contacts function by passing in a first name and checking that the result is equal to contacts.
-        
-        
-        :param self: Represent the instance of the class
-        :return: Contacts
-        :doc-author: Trelent
-        """
-        contacts = [self.contact_test, Contact(), Contact()]
-        self.session.query().filter().all.return_value = contacts
-        result = await get_contacts(skip=0, limit=10, first_name=self.contact_test.first_name, last_name='', email='', user=self.user, db=self.session)
-        self.assertEqual(result, contacts)
-
-    async def test_get_contacts_filter_by_last_name(self):
-        """
-        The test_get_contacts_filter_by_last_name function tests the get_contacts function by passing in a last name to filter by.
-        The test passes if the result is equal to contacts.
-        
-        :param self: Represent the instance of the class
-        :return: A list of contacts
-        :doc-author: Trelent
-        """
-        contacts = [self.contact_test, Contact(), Contact()]
-        self.session.query().filter().all.return_value = contacts
-        result = await get_contacts(skip=0, limit=10, first_name='', last_name=self.contact_test.last_name, email='', user=self.user, db=self.session)
-        self.assertEqual(result, contacts)
-
-    async def test_get_contacts_filter_by_email(self):
-        """
-        The test_get_contacts_filter_by_email function tests the get_contacts function with a filter by email.
-            The test_get_contacts_filter_by_email function creates a list of contacts, and then sets the return value of 
-            self.session.query().filter().all to be that list of contacts (this is done so that we can test what happens when 
-            there are multiple results returned from the database). Then, it calls get_contacts with an email parameter set to 
-            self.contact's email attribute (which was set in setup), and asserts that result is equal to our list of contacts.
-        
-        :param self: Access the attributes and methods of the class
-        :return: The list of contacts that match the email address
-        :doc-author: Trelent
-        """
-        contacts = [self.contact_test, Contact(), Contact()]
-        self.session.query().filter().all.return_value = contacts
-        result = await get_contacts(skip=0, limit=10, first_name='', last_name='', email=self.contact_test.email, user=self.user, db=self.session)
-        self.assertEqual(result, contacts)
-
-    async def test_get_contact_by_id(self):
-        """
-        The test_get_contact_by_id function tests the get_contact_by_id function.
-            It does this by mocking the session object and returning a list of contacts.
-            The test then asserts that the result is equal to that list.
-        
-        :param self: Represent the instance of the object that is passed to the method when it is called
-        :return: A list of contacts
-        :doc-author: Trelent
-        """
-        contacts = [self.contact_test, Contact(), Contact()]
-        self.session.query().filter().first.return_value = contacts
-        result = await get_contact_by_id(contact_id=self.contact_test.id, user=self.user, db=self.session)
-        self.assertEqual(result, contacts)
-
-    async def test_create_contact(self):
-        """
-        The test_create_contact function tests the create_contact function in the contacts.py file.
-        It creates a ContactModel object and passes it to the create_contact function, which should return a new contact with an id attribute.
-        
-        :param self: Represent the instance of the class
-        :return: The result of the create_contact function
-        :doc-author: Trelent
-        """
-        body = ContactModel(
-            first_name=self.contact_test.first_name,
-            last_name=self.contact_test.last_name,
-            email=self.contact_test.email,
-            phone=self.contact_test.email,
-            date_of_birth=self.contact_test.date_of_birth,
+    :param session: Mock the database session
+    :param user: Pass the owner of the new contact
+    :param contact_body: Pass the request body of the new contact
+    :return: The result of the create_contact function
+    :doc-author: Trelent
+    """
+    body = contact_body
+    result = create_contact(body=body, db=session, user=user)
+    assert result.first_name == body.first_name
+    assert result.last_name == body.last_name
+    assert result.email == body.email
+    assert result.phone == body.phone
+    assert result.date_of_birth == body.date_of_birth
+    assert hasattr(result, "id")
+
+
+def test_remove_contact(session, user, contact_test):
+    """
+    The test_remove_contact function tests the remove_contact function.
+        It does this by mocking the result of the delete statement, so that one row is reported as deleted.
+        The test passes if remove_contact returns the number of deleted rows.
+
+    :param session: Mock the database session
+    :param user: Pass the owner of the contact
+    :param contact_test: Pass the contact to remove
+    :return: The number of deleted contacts
+    :doc-author: Trelent
+    """
+    session.execute.return_value.rowcount = 1
+    result = remove_contact(contact_id=contact_test.id, db=session, user=user)
+    assert result == 1
+
+
+def test_remove_contact_not_found(session, user, contact_test):
+    """
+    The test_remove_contact_not_found function tests the remove_contact function when a contact is not found.
+        The test_remove_contact_not_found function uses the mock library to mock out the session object so that
+        the delete statement affects no rows.  It then calls remove_contact with an id that does not exist in the database, and
+        asserts that it returns 0.
+
+    :param session: Mock the database session
+    :param user: Pass the owner of the contact
+    :param contact_test: Pass the contact to remove
+    :return: None
+    :doc-author: Trelent
+    """
+    session.execute.return_value.rowcount = 0
+    result = remove_contact(contact_id=contact_test.id, db=session, user=user)
+    assert result == 0
+
+
+def test_update_contact(session, user, contact_test, contact_body):
+    """
+    The test_update_contact function tests the update_contact function.
+        It does this by creating a ContactModel object, and then passing it to the update_contact function.
+        The test checks that the result of calling update_contact is equal to contact.
+
+    :param session: Mock the database session
+    :param user: Pass the owner of the contact
+    :param contact_test: Pass the contact to update
+    :param contact_body: Pass the request body with the new contact data
+    :return: The contact object
+    :doc-author: Trelent
+    """
+    contact = contact_test
+    body = contact_body
+    session.get.return_value = contact
+    result = update_contact(contact_id=contact_test.id, body=body, db=session, user=user)
+    assert result == contact
+
+
+def test_update_contact_not_found(session, user, contact_test, contact_body):
+    """
+    The test_update_contact_not_found function tests the update_contact function when a contact is not found.
+        The test_update_contact_not_found function uses the following parameters:
+            session - A mocked database session that finds no contact.
+        The test_update_contact function returns nothing.
+
+    :param session: Mock the database session
+    :param user: Pass the owner of the contact
+    :param contact_test: Pass the id of the contact that is not found
+    :param contact_body: Pass the request body with the new contact data
+    :return: None, but the function returns a tuple
+    :doc-author: Trelent
+    """
+    body = contact_body
+    session.get.return_value = None
+    result = update_contact(contact_id=contact_test.id, body=body, db=session, user=user)
+    assert result is None
+
+
+def test_get_contacts_birthdays(session, query_chain, user):
+    """
+    The test_get_contacts_birthdays function tests the get_contacts_birthdays function.
+        It checks that the contacts found by the mocked query are returned unchanged;
+        the birthday window itself is tested against the test database below.
+
+    :param session: Mock the database session
+    :param query_chain: Set the result of the mocked query
+    :param user: Pass the owner of the contacts
+    :return: Contacts
+    :doc-author: Trelent
+    """
+    query_chain.ordered_all.return_value = list(_BIRTHDAY_CONTACTS)
+    result = get_contacts_birthdays(0, 10, user, session)
+    assert result == list(_BIRTHDAY_CONTACTS)
+
+
+@pytest.fixture
+def stored_users(db_session):
+    """
+    The stored_users function is a fixture that stores two users in the test database:
+    the owner of the contacts that are looked up and another user.
+    Their contacts and the users themselves are deleted after the test function.
+
+    :param db_session: Get the test database session
+    :return: The owner and the other user
+    :doc-author: Trelent
+    """
+    owner = User(username='Nami', email='strawhatnavigator@meta.ua', password='1597536482')
+    other = User(username='Sanji', email='strawhatcook@meta.ua', password='1597536482')
+    db_session.add_all([owner, other])
+    db_session.commit()
+    yield owner, other
+    db_session.query(Contact).filter(Contact.user_id.in_([owner.id, other.id])).delete(synchronize_session=False)
+    db_session.delete(owner)
+    db_session.delete(other)
+    db_session.commit()
+
+
+@pytest.mark.parametrize('today', [date(2023, 6, 10), date(2023, 12, 28)])
+def test_get_contacts_birthdays_window(today, db_session, stored_users, monkeypatch):
+    """
+    The test_get_contacts_birthdays_window function tests the birthday filter of get_contacts_birthdays
+    against the test database. It stores contacts whose birthday is today, in 7 days and in 8 days,
+    and a contact of another user whose birthday is today. Only the first two are returned.
+    The second date makes the 7 days window cross the end of the year.
+
+    :param today: Set the date returned by date.today in the contacts repository
+    :param db_session: Get the test database session
+    :param stored_users: Get the owner of the contacts and another user
+    :param monkeypatch: Replace the date class used by the contacts repository
+    :return: None
+    :doc-author: Trelent
+    """
+    class FrozenDate(date):
+        @classmethod
+        def today(cls):
+            return today
+
+    monkeypatch.setattr('src.repository.contacts.date', FrozenDate)
+    owner, other = stored_users
+    birthdays = [(owner, 0), (owner, 7), (owner, 8), (other, 0)]
+    db_session.add_all([
+        Contact(
+            first_name='Birthday',
+            last_name=str(number),
+            email=f'birthday{number}@meta.ua',
+            phone=f'+38050000000{number}',
+            date_of_birth=(today + timedelta(days=offset)).replace(year=1994),
+            user_id=contact_user.id,
         )
-        result = await create_contact(body=body, db=self.session, user=self.user)
-        self.assertEqual(result.first_name, body.first_name)
-        self.assertEqual(result.last_name, body.last_name)
-        self.assertEqual(result.email, body.email)
-        self.assertEqual(result.phone, body.phone)
-        self.assertEqual(result.date_of_birth, body.date_of_birth)
-        self.assertTrue(hasattr(result, "id"))
-
-    async def test_remove_contact(self):
-        """
-        The test_remove_contact function tests the remove_contact function.
-            It does this by creating a mock contact, and then using that mock contact to test the remove_contact function.
-            The test passes if the result of calling remove_contact is equal to our mock contact.
-        
-        :param self: Represent the instance of the class
-        :return: The contact that was deleted
-        :doc-author: Trelent
-        """
-        contact = self.contact_test
-        self.session.query().filter().first.return_value = contact
-        result = await remove_contact(contact_id=self.contact_test.id, db=self.session, user=self.user)
-        self.assertEqual(result, contact)
-
-    async def test_remove_contact_not_found(self):
-        """
-        The test_remove_contact_not_found function tests the remove_contact function when a contact is not found.
-            The test_remove_contact_not_found function uses the mock library to mock out the session object and return None
-            when querying for a contact.  It then calls remove_contact with an id that does not exist in the database, and
-            asserts that it returns None.
-        
-        :param self: Represent the instance of the class
-        :return: None
-        :doc-author: Trelent
-        """
-        self.session.query().filter().first.return_value = None
-        result = await remove_contact(contact_id=self.contact_test.id, db=self.session, user=self.user)
-        self.assertIsNone(result)
-
-    async def test_update_contact(self):
-        """
-        The test_update_contact function tests the update_contact function.
-            It does this by creating a ContactModel object, and then passing it to the update_contact function.
-            The test checks that the result of calling update_contact is equal to contact.
-        
-        :param self: Represent the instance of the class
-        :return: The contact object
-        :doc-author: Trelent
-        """
-        contact = self.contact_test
-        body = ContactModel(
-            first_name='Luffy',
-            last_name=self.contact_test.last_name,
-            email=self.contact_test.email,
-            phone=self.contact_test.email,
-            date_of_birth=self.contact_test.date_of_birth)
-        self.session.query().filter().first.return_value = contact
-        result = await update_contact(contact_id=self.contact_test.id, body=body, db=self.session, user=self.user)
-        self.assertEqual(result, contact)
-
-    async def test_update_contact_not_found(self):
-        """
-        The test_update_contact_not_found function tests the update_contact function when a contact is not found.
-            The test_update_contact_not_found function uses the following parameters:
-                self - A reference to the current instance of this class.
-            The test_update_contact function returns nothing.
-        
-        :param self: Refer to the class itself
-        :return: None, but the function returns a tuple
-        :doc-author: Trelent
-        """
-        body = ContactModel(
-            first_name='Luffy',
-            last_name=self.contact_test.last_name,
-            email=self.contact_test.email,
-            phone=self.contact_test.email,
-            date_of_birth=self.contact_test.date_of_birth)
-        self.session.query().filter().first.return_value = None
-        result = await update_contact(contact_id=self.contact_test.id, body=body, db=self.session, user=self.user)
-        self.assertIsNone(result)
-
-    async def test_get_contacts_birthdays(self):
-        """
-        The test_get_contacts_birthdays function tests the get_contacts_birthdays function.
-        
-        :param self: Represent the instance of the class
-        :return: Contacts
-        :doc-author: Trelent
-        """
-        today = date.today()
-        contacts = [
-            Contact(id=1, first_name='Luffy', last_name='Monkey',
-                    email='strawhatcaptain@meta.ua', date_of_birth=today),
-            Contact(id=2, first_name='Zoro', last_name='Roronoa',
-                    email='strawhatswordsman@meta.ua', date_of_birth=today),
-        ]
-        self.session.query().filter().offset().limit().all.return_value = contacts
-
-        result = await get_contacts_birthdays(0, 10, self.user, self.session)
-        self.assertEqual(result, contacts)
-
-
-if __name__ == '__main__':
-    unittest.main()
+        for number, (contact_user, offset) in enumerate(birthdays)
+    ])
+    db_session.commit()
+
+    result = get_contacts_birthdays(0, 10, owner, db_session)
+    assert [contact.email for contact in result] == ['birthday0@meta.ua', 'birthday1@meta.ua']
+
+
+def test_get_contacts_filter_stored(db_session, stored_users):
+    """
+    The test_get_contacts_filter_stored function tests the filters of get_contacts against the test database.
+        It stores a contact of the owner matching the first name, one matching the email, one matching neither
+        and a contact of another user matching the first name. Only the owner's two matches are returned, by id.
+
+    :param db_session: Get the test database session
+    :param stored_users: Get the owner of the contacts and another user
+    :return: None
+    :doc-author: Trelent
+    """
+    owner, other = stored_users
+    contacts = [
+        Contact(first_name='Luffy', last_name='Monkey', email='filter0@meta.ua', phone='+380670000000',
+                date_of_birth=_TODAY, user_id=owner.id),
+        Contact(first_name='Usopp', last_name='Sogeking', email='filter1@meta.ua', phone='+380670000001',
+                date_of_birth=_TODAY, user_id=owner.id),
+        Contact(first_name='Zoro', last_name='Roronoa', email='filter2@meta.ua', phone='+380670000002',
+                date_of_birth=_TODAY, user_id=owner.id),
+        Contact(first_name='Luffy', last_name='Monkey', email='filter3@meta.ua', phone='+380670000003',
+                date_of_birth=_TODAY, user_id=other.id),
+    ]
+    db_session.add_all(contacts)
+    db_session.commit()
+
+    result = get_contacts(skip=0, limit=10, first_name='Luffy', last_name='', email='filter2@meta.ua',
+                          user=owner, db=db_session)
+    assert [contact.id for contact in result] == [contacts[0].id, contacts[2].id]
@@ -0,0 +1,79 @@
+import asyncio
+from time import time
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import HTTPException
+
+from src.database.models import User
+from src.services.auth import auth_service, _decode_token
+
+
+@pytest.fixture
+def user():
+    """
+    The user function is a fixture that creates the user whose tokens are checked in each test function.
+
+    :return: A user object
+    :doc-author: Trelent
+    """
+    return User(id=1, username='NewUser', email='newuser@gmail.com', password='1597536482', confirmed=True)
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """
+    The cache function is a fixture that replaces the redis client of auth_service with a mock
+    that never finds a cached user.
+
+    :param monkeypatch: Replace the redis client of auth_service
+    :return: The mocked redis client
+    :doc-author: Trelent
+    """
+    cache = AsyncMock()
+    cache.get.return_value = None
+    monkeypatch.setattr(auth_service, 'r', cache)
+    return cache
+
+
+def test_get_current_user_expired_cached_token(session, cache, user, monkeypatch):
+    """
+    The test_get_current_user_expired_cached_token function tests that an access token is rejected once it expires,
+        even though its payload is already cached by _decode_token and jose does not check it again.
+        The first call returns the user and caches the payload, then the time is moved past the expiration.
+
+    :param session: Mock the database session
+    :param cache: Mock the redis client
+    :param user: Pass the user returned by the mocked database
+    :param monkeypatch: Move the time used by auth_service past the expiration of the token
+    :return: None
+    :doc-author: Trelent
+    """
+    session.query.return_value.filter.return_value.first.return_value = user
+    token = auth_service.create_access_token(data={'sub': user.email}, expires_delta=60)
+
+    result = asyncio.run(auth_service.get_current_user(token, session))
+    assert result.email == user.email
+
+    hits = _decode_token.cache_info().hits
+    monkeypatch.setattr('src.services.auth.time', lambda: time() + 120)
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(auth_service.get_current_user(token, session))
+    assert error.value.status_code == 401
+    assert _decode_token.cache_info().hits == hits + 1
+
+
+def test_get_current_user_refresh_token(session, cache, user):
+    """
+    The test_get_current_user_refresh_token function tests that a refresh token cannot be used as an access token.
+
+    :param session: Mock the database session
+    :param cache: Mock the redis client
+    :param user: Pass the user whose token is checked
+    :return: None
+    :doc-author: Trelent
+    """
+    token = auth_service.create_refresh_token(data={'sub': user.email})
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(auth_service.get_current_user(token, session))
+    assert error.value.status_code == 401